@@ -1,18 +1,38 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import logging
+import time
 from collections import defaultdict
-from typing import Any, Callable, DefaultDict, Dict, List, Optional, Set, Tuple, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from itertools import chain, repeat
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
+import pyarrow as pa
+from arango.collection import StandardCollection
 from arango.cursor import Cursor
 from arango.database import StandardDatabase
 from arango.graph import Graph as ADBGraph
+from arango.job import AsyncJob
 from cudf import DataFrame, Series
 from cugraph import Graph as CUGGraph
 from cugraph import MultiGraph as CUGMultiGraph
 from rich.console import Group
 from rich.live import Live
-from rich.progress import Progress
+from rich.progress import Progress, TaskID
 
 from .abc import Abstract_ADBCUG_Adapter
 from .controller import ADBCUG_Controller
@@ -22,8 +42,41 @@ from .utils import (
     get_export_spinner_progress,
     get_import_spinner_progress,
     logger,
+    set_rmm_pool,
 )
 
+# The AQL queries used to export ArangoDB documents. The collection and edge
+# attribute are bind parameters, so the query strings never need rebuilding.
+# A flat projection also avoids building a KEEP() copy of every document.
+# Edges are returned as positional [_from, _to, weight] rows, so that
+# attribute names are not repeated in every serialized edge.
+VERTEX_EXPORT_AQL = "FOR doc IN @@col RETURN {_id: doc._id}"
+EDGE_EXPORT_AQL = "FOR doc IN @@col RETURN [doc._from, doc._to]"
+WEIGHTED_EDGE_EXPORT_AQL = "FOR doc IN @@col RETURN [doc._from, doc._to, doc.@attr]"
+
+# The number of documents fetched per ArangoDB cursor round trip, unless the
+# user specifies a **batch_size** AQL query option
+DEFAULT_ADB_EXPORT_BATCH_SIZE = 100000
+
+# The number of ArangoDB edge collections exported at once
+MAX_CONCURRENT_ADB_EXPORTS = 8
+
+# The number of ArangoDB collections imported into at once (each collection
+# has at most one batch in flight, so that its imports keep their order)
+MAX_PENDING_ADB_IMPORTS = 4
+
+# The largest number of documents in a single asynchronous ArangoDB import job,
+# so that large batches are imported by several concurrent jobs
+MAX_ADB_IMPORT_SIZE = 50000
+
+# The first & longest wait (in seconds) between two status checks of an
+# asynchronous ArangoDB import job. The wait doubles after every check.
+MIN_ADB_JOB_POLL_INTERVAL = 0.01
+MAX_ADB_JOB_POLL_INTERVAL = 1.0
+
+# The number of cuGraph nodes/edges processed between progress bar updates
+PROGRESS_UPDATE_INTERVAL = 4096
+
 
 class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
     """ArangoDB-cuGraph adapter.
@@ -33,37 +86,78 @@ class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
     :param controller: The ArangoDB-cuGraph controller, used to prepare ArangoDB
         nodes before insertion into cuGraph, optionally re-defined by the user
         if needed (otherwise defaults to ADBCUG_Controller).
-    :type controller: ADBCUG_Controller
+    :type controller: ADBCUG_Controller | None
     :param logging_lvl: Defaults to logging.INFO. Other useful options are
         logging.DEBUG (more verbose), and logging.WARNING (less verbose).
     :type logging_lvl: str | int
+    :param rmm_pool_init_size: If specified, serves the GPU allocations of cuDF
+        & cuGraph from an RMM memory pool of this initial size (in bytes),
+        instead of allocating (and freeing) device memory buffer by buffer.
+        Ignored if an RMM memory resource has already been set. Defaults to None.
+    :type rmm_pool_init_size: int | None
+    :param rmm_pool_max_size: The maximum size (in bytes) the RMM memory pool
+        can grow to. Only used with **rmm_pool_init_size**. Defaults to None
+        (i.e no limit).
+    :type rmm_pool_max_size: int | None
     :raise TypeError: If invalid parameters
     """
 
     def __init__(
         self,
         db: StandardDatabase,
-        controller: ADBCUG_Controller = ADBCUG_Controller(),
+        controller: Optional[ADBCUG_Controller] = None,
         logging_lvl: Union[str, int] = logging.INFO,
+        rmm_pool_init_size: Optional[int] = None,
+        rmm_pool_max_size: Optional[int] = None,
     ):
         self.set_logging(logging_lvl)
 
-        if issubclass(type(db), StandardDatabase) is False:
+        if controller is None:
+            controller = ADBCUG_Controller()
+
+        if not isinstance(db, StandardDatabase):
             msg = "**db** parameter must inherit from arango.database.StandardDatabase"
             raise TypeError(msg)
 
-        if issubclass(type(controller), ADBCUG_Controller) is False:
+        if not isinstance(controller, ADBCUG_Controller):
             msg = "**controller** parameter must inherit from ADBCUG_Controller"
             raise TypeError(msg)
 
         self.__db = db
-        self.__async_db = db.begin_async_execution(return_result=False)
+        self.__async_db = db.begin_async_execution(return_result=True)
 
         self.__cntrl: ADBCUG_Controller = controller
         self.__prepare_adb_vertex_method_is_empty = (
             controller.__class__._prepare_arangodb_vertex
             is ADBCUG_Controller._prepare_arangodb_vertex
         )
+        self.__identify_cug_node_method_is_default = (
+            controller.__class__._identify_cugraph_node
+            is ADBCUG_Controller._identify_cugraph_node
+        )
+        self.__identify_cug_edge_method_is_default = (
+            controller.__class__._identify_cugraph_edge
+            is ADBCUG_Controller._identify_cugraph_edge
+        )
+        self.__keyify_cug_node_method_is_default = (
+            controller.__class__._keyify_cugraph_node
+            is ADBCUG_Controller._keyify_cugraph_node
+        )
+        self.__keyify_cug_edge_method_is_default = (
+            controller.__class__._keyify_cugraph_edge
+            is ADBCUG_Controller._keyify_cugraph_edge
+        )
+        self.__prepare_cug_node_method_is_empty = (
+            controller.__class__._prepare_cugraph_node
+            is ADBCUG_Controller._prepare_cugraph_node
+        )
+        self.__prepare_cug_edge_method_is_empty = (
+            controller.__class__._prepare_cugraph_edge
+            is ADBCUG_Controller._prepare_cugraph_edge
+        )
+
+        if rmm_pool_init_size is not None:
+            set_rmm_pool(rmm_pool_init_size, rmm_pool_max_size)
 
         logger.info(f"Instantiated ADBCUG_Adapter with database '{db.name}'")
 
@@ -89,6 +183,7 @@ class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
         edge_attr: str = "weights",
         default_edge_attr_value: int = 0,
         cug_graph: Optional[CUGMultiGraph] = None,
+        weight_dtype: Optional[str] = None,
         **adb_export_kwargs: Any,
     ) -> CUGMultiGraph:
         """Create a cuGraph graph from an ArangoDB metagraph.
@@ -103,8 +198,16 @@ class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
             will set the edge weight value to **default_edge_attr_value**.
         :type edge_attr: str
         :param default_edge_attr_value: The default value set to the edge attribute
-            if **edge_attr** is not present in the ArangoDB edge. Defaults to 0.
+            if **edge_attr** is missing (or null) in the ArangoDB edge. Defaults to 0.
         :type default_edge_attr_value: int
+        :param cug_graph: An existing cuGraph graph to populate. Defaults to None.
+        :type cug_graph: cugraph.structure.graph_classes.MultiDiGraph | None
+        :param weight_dtype: If specified, casts the edge weights to this type
+            before they are copied to the GPU, trading precision for transfer
+            size & device memory. Supports 'float32' & 'float64' ('float16' is
+            not, as pyarrow cannot cast to it). Defaults to None, which keeps
+            the type inferred from the ArangoDB values.
+        :type weight_dtype: str | None
         :param adb_export_kwargs: Keyword arguments to specify AQL query options when
             fetching documents from the ArangoDB instance. Full parameter list:
             https://docs.python-arango.com/en/main/specs.html#arango.aql.AQL.execute
@@ -127,60 +230,76 @@ class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
         """
         logger.debug(f"--arangodb_to_cugraph('{name}')--")
 
+        missing_keys = {"vertexCollections", "edgeCollections"} - metagraph.keys()
+        if missing_keys:
+            msg = f"Missing required keys in metagraph: {sorted(missing_keys)}"
+            raise ValueError(msg)
+
         # This maps the ArangoDB vertex IDs to cuGraph node IDs
         adb_map: Dict[str, CUGId] = dict()
 
-        # This stores the to-be-inserted cuGraph edges (coo format)
-        cug_edges: List[Tuple[CUGId, CUGId, Any]] = []
+        # This stores the to-be-inserted cuGraph edges of each edge collection
+        # (coo format, by column)
+        cug_edges: List[Dict[str, List[Any]]] = []
 
         ######################
         # Vertex Collections #
         ######################
 
-        for v_col, _ in metagraph["vertexCollections"].items():
-            logger.debug(f"Preparing '{v_col}' vertices")
+        # Vertices are only needed to let the controller re-identify them,
+        # so the default controller skips fetching them altogether
+        v_cols: List[str] = (
+            []
+            if self.__prepare_adb_vertex_method_is_empty
+            else list(metagraph["vertexCollections"])
+        )
 
-            # 1. Fetch ArangoDB vertices
-            v_col_cursor, v_col_size = self.__fetch_adb_docs(
-                v_col, is_edge=False, edge_attr=None, **adb_export_kwargs
-            )
+        bar_progress = get_bar_progress("(ADB → CUG): '{task.description}'", "#8000FF")
+        spinner_progress = get_export_spinner_progress("    ")
 
-            # 2. Process ArangoDB vertices
-            self.__process_adb_cursor(
-                "#8000FF",
-                v_col_cursor,
-                v_col_size,
-                self.__process_adb_vertex,
-                v_col,
-                adb_map,
-            )
+        # The controller may keep state across vertices, so it is only called
+        # from this thread, one collection at a time (in metagraph order)
+        with Live(Group(bar_progress, spinner_progress)):
+            for v_col in v_cols:
+                self.__process_adb_v_col(
+                    v_col,
+                    adb_map,
+                    bar_progress,
+                    spinner_progress,
+                    **adb_export_kwargs,
+                )
 
         ####################
         # Edge Collections #
         ####################
 
-        for e_col, _ in metagraph["edgeCollections"].items():
-            logger.debug(f"Preparing '{e_col}' edges")
+        e_cols: List[str] = list(metagraph["edgeCollections"])
 
-            # 1. Fetch ArangoDB edges
-            e_col_cursor, e_col_size = self.__fetch_adb_docs(
-                e_col, is_edge=True, edge_attr=edge_attr, **adb_export_kwargs
-            )
+        bar_progress = get_bar_progress("(ADB → CUG): '{task.description}'", "#FFFFFF")
+        spinner_progress = get_export_spinner_progress("    ")
 
-            # 2. Process ArangoDB edges
-            self.__process_adb_cursor(
-                "#FFFFFF",
-                e_col_cursor,
-                e_col_size,
-                self.__process_adb_edge,
-                e_col,
-                adb_map,
-                cug_edges,
-                edge_attr,
-                default_edge_attr_value,
-            )
+        process_adb_e_col = partial(
+            self.__process_adb_e_col,
+            bar_progress=bar_progress,
+            spinner_progress=spinner_progress,
+            edge_attr=edge_attr,
+            **adb_export_kwargs,
+        )
 
-        cug_graph = self.__create_cug_graph(cug_graph, cug_edges, edge_attr)
+        with Live(Group(bar_progress, spinner_progress)):
+            with ThreadPoolExecutor(
+                max_workers=min(len(e_cols), MAX_CONCURRENT_ADB_EXPORTS) or 1
+            ) as executor:
+                cug_edges.extend(executor.map(process_adb_e_col, e_cols))
+
+        cug_graph = self.__create_cug_graph(
+            cug_graph,
+            cug_edges,
+            adb_map,
+            edge_attr,
+            default_edge_attr_value,
+            weight_dtype,
+        )
 
         logger.info(f"Created cuGraph '{name}' Graph")
         return cug_graph
@@ -192,6 +311,7 @@ class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
         e_cols: Set[str],
         edge_attr: str = "weights",
         default_edge_attr_value: int = 0,
+        weight_dtype: Optional[str] = None,
         **adb_export_kwargs: Any,
     ) -> CUGMultiGraph:
         """Create a cuGraph graph from ArangoDB collections.
@@ -206,8 +326,14 @@ class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
             will set the edge weight value to 0.
         :type edge_attr: str
         :param default_edge_attr_value: The default value set to the edge attribute
-            if **edge_attr** is not present in the ArangoDB edge. Defaults to 0.
+            if **edge_attr** is missing (or null) in the ArangoDB edge. Defaults to 0.
         :type default_edge_attr_value: int
+        :param weight_dtype: If specified, casts the edge weights to this type
+            before they are copied to the GPU, trading precision for transfer
+            size & device memory. Supports 'float32' & 'float64' ('float16' is
+            not, as pyarrow cannot cast to it). Defaults to None, which keeps
+            the type inferred from the ArangoDB values.
+        :type weight_dtype: str | None
         :param adb_export_kwargs: Keyword arguments to specify AQL query options when
             fetching documents from the ArangoDB instance. Full parameter list:
             https://docs.python-arango.com/en/main/specs.html#arango.aql.AQL.execute
@@ -221,7 +347,12 @@ class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
         }
 
         return self.arangodb_to_cugraph(
-            name, metagraph, edge_attr, default_edge_attr_value, **adb_export_kwargs
+            name,
+            metagraph,
+            edge_attr,
+            default_edge_attr_value,
+            weight_dtype=weight_dtype,
+            **adb_export_kwargs,
         )
 
     def arangodb_graph_to_cugraph(
@@ -229,6 +360,7 @@ class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
         name: str,
         edge_attr: str = "weights",
         default_edge_attr_value: int = 0,
+        weight_dtype: Optional[str] = None,
         **adb_export_kwargs: Any,
     ) -> CUGMultiGraph:
         """Create a cuGraph graph from an ArangoDB graph.
@@ -239,8 +371,14 @@ class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
             will set the edge weight value to 0.
         :type edge_attr: str
         :param default_edge_attr_value: The default value set to the edge attribute
-            if **edge_attr** is not present in the ArangoDB edge. Defaults to 0.
+            if **edge_attr** is missing (or null) in the ArangoDB edge. Defaults to 0.
         :type default_edge_attr_value: int
+        :param weight_dtype: If specified, casts the edge weights to this type
+            before they are copied to the GPU, trading precision for transfer
+            size & device memory. Supports 'float32' & 'float64' ('float16' is
+            not, as pyarrow cannot cast to it). Defaults to None, which keeps
+            the type inferred from the ArangoDB values.
+        :type weight_dtype: str | None
         :param adb_export_kwargs: Keyword arguments to specify AQL query options when
             fetching documents from the ArangoDB instance. Full parameter list:
             https://docs.python-arango.com/en/main/specs.html#arango.aql.AQL.execute
@@ -259,6 +397,7 @@ class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
             e_cols,
             edge_attr,
             default_edge_attr_value,
+            weight_dtype,
             **adb_export_kwargs,
         )
 
@@ -299,11 +438,15 @@ class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
             Does not drop associated collections.
         :type overwrite_graph: bool
         :param batch_size: If specified, runs the ArangoDB Data Ingestion
-            process for every **batch_size** cuGraph nodes/edges within **cug_graph**.
-            Defaults to `len(cug_nodes)` & `len(cug_edges)`.
+            process for every **batch_size** cuGraph nodes/edges within **cug_graph**,
+            which bounds the number of ArangoDB documents held in memory at once.
+            Defaults to `len(cug_nodes)` & `len(cug_edges)`. Note that **overwrite**
+            empties a collection on every import, so combining it with
+            **batch_size** only keeps the last batch of each collection.
         :type batch_size: int | None
-        :param use_async: Performs asynchronous ArangoDB ingestion if enabled.
-            Defaults to False.
+        :param use_async: Performs asynchronous ArangoDB ingestion if enabled:
+            the import requests of a batch are run as concurrent ArangoDB jobs,
+            which are all awaited before returning. Defaults to False.
         :type use_async: bool
         :param src_series_key: The cuGraph edge list source series key.
             Defaults to 'src'.
@@ -350,90 +493,221 @@ class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
         has_one_e_col = len(adb_e_cols) == 1
         logger.debug(f"Is '{name}' homogeneous? {has_one_v_col and has_one_e_col}")
 
+        # Fail before any document is inserted, rather than on the first
+        # node or edge that the default controller cannot identify
+        if not has_one_v_col and self.__identify_cug_node_method_is_default:
+            msg = f"""User must override _identify_cugraph_node(),
+            since there are {len(adb_v_cols)} vertex collections
+            to choose from
+            """
+            raise NotImplementedError(msg)
+
+        if not has_one_e_col and self.__identify_cug_edge_method_is_default:
+            msg = f"""User must override _identify_cugraph_edge(),
+            since there are {len(adb_e_cols)} edge collections
+            to choose from
+            """
+            raise NotImplementedError(msg)
+
         # This maps cuGraph node IDs to ArangoDB vertex IDs
         cug_map: Dict[CUGId, str] = dict()
 
         # This stores the to-be-inserted ArangoDB documents by collection name
         adb_docs: DefaultDict[str, List[Json]] = defaultdict(list)
 
-        spinner_progress = get_import_spinner_progress("    ")
+        # This stores the pending ArangoDB import of each collection
+        adb_imports: Dict[str, Future[List[Json]]] = dict()
 
-        #################
-        # cuGraph Nodes #
-        #################
+        spinner_progress = get_import_spinner_progress("    ")
 
-        cug_id: CUGId
-        node_batch_size = batch_size or len(cug_nodes)
+        # Imports are sent in the background while the next batch is built
+        with ThreadPoolExecutor(max_workers=MAX_PENDING_ADB_IMPORTS) as import_executor:
+            #################
+            # cuGraph Nodes #
+            #################
+
+            node_batch_size = batch_size or max(len(cug_nodes), 1)
+
+            # Homogeneous graphs skip the controller (and its validation) entirely
+            identify_cug_node: Callable[[CUGId, List[str]], str]
+            if has_one_v_col:
+                identify_cug_node = self.__identify_cug_node_of_one_col
+            else:
+                adb_v_col_set = frozenset(adb_v_cols)
+                identify_cug_node = partial(
+                    self.__identify_cug_node, adb_v_col_set=adb_v_col_set
+                )
 
-        bar_progress = get_bar_progress("(CUG → ADB): Nodes", "#97C423")
-        bar_progress_task = bar_progress.add_task("Nodes", total=len(cug_nodes))
+            # The nodes & edges of a homogeneous graph that the controller neither
+            # keys nor prepares are built as columns on the GPU instead
+            is_default_cug_node = (
+                has_one_v_col
+                and self.__keyify_cug_node_method_is_default
+                and self.__prepare_cug_node_method_is_empty
+            )
+            is_default_cug_edge = (
+                is_default_cug_node
+                and has_one_e_col
+                and self.__keyify_cug_edge_method_is_default
+                and self.__prepare_cug_edge_method_is_empty
+            )
 
-        with Live(Group(bar_progress, spinner_progress)):
-            for i, cug_id in enumerate(cug_nodes, 1):
-                bar_progress.advance(bar_progress_task)
-
-                # 1. Process cuGraph node
-                self.__process_cug_node(
-                    i,
-                    cug_id,
-                    cug_map,
-                    adb_docs,
-                    adb_v_cols,
-                    has_one_v_col,
-                )
+            adb_v_docs: Optional[DataFrame] = None
+            if is_default_cug_node:
+                adb_v_docs = self.__get_default_adb_vertices(cug_nodes, adb_v_cols[0])
 
-                # 2. Insert batch of nodes
-                if i % node_batch_size == 0:
-                    self.__insert_adb_docs(
-                        spinner_progress, adb_docs, use_async, **adb_import_kwargs
+                if not is_default_cug_edge:
+                    cug_map.update(
+                        zip(
+                            cug_nodes.to_arrow().to_pylist(),
+                            adb_v_docs["_id"].to_arrow().to_pylist(),
+                        )
                     )
 
-            # Insert remaining nodes
-            self.__insert_adb_docs(
-                spinner_progress, adb_docs, use_async, **adb_import_kwargs
-            )
+            bar_progress = get_bar_progress("(CUG → ADB): Nodes", "#97C423")
+            bar_progress_task = bar_progress.add_task("Nodes", total=len(cug_nodes))
 
-        #################
-        # cuGraph Edges #
-        #################
-
-        from_node_id: CUGId
-        to_node_id: CUGId
-        edge_batch_size = batch_size or len(cug_edges)
+            with Live(Group(bar_progress, spinner_progress)):
+                # Pull the nodes off the GPU once, as Arrow, instead of once per node.
+                # The collection is implied by the import, so only _key is sent
+                adb_v_table = (
+                    adb_v_docs[["_key"]].to_arrow() if adb_v_docs is not None else None
+                )
+                cug_nodes_table = cug_nodes.to_arrow() if adb_v_docs is None else None
+
+                for start in range(0, len(cug_nodes), node_batch_size):
+                    # 1. Process cuGraph nodes
+                    if adb_v_table is not None:
+                        adb_v_batch = adb_v_table.slice(start, node_batch_size)
+                        adb_docs[adb_v_cols[0]].extend(adb_v_batch.to_pylist())
+                        end = start + len(adb_v_batch)
+
+                    else:
+                        # Only the current batch is converted into Python objects
+                        cug_ids = cug_nodes_table.slice(
+                            start, node_batch_size
+                        ).to_pylist()
+
+                        for i, cug_id in enumerate(cug_ids, start + 1):
+                            self.__process_cug_node(
+                                i,
+                                cug_id,
+                                cug_map,
+                                adb_docs,
+                                adb_v_cols,
+                                identify_cug_node,
+                            )
+
+                            if i % PROGRESS_UPDATE_INTERVAL == 0:
+                                bar_progress.update(bar_progress_task, completed=i)
+
+                        end = start + len(cug_ids)
+
+                    bar_progress.update(bar_progress_task, completed=end)
+
+                    # 2. Insert batch of nodes
+                    self.__insert_adb_docs(
+                        import_executor,
+                        spinner_progress,
+                        adb_docs,
+                        use_async,
+                        adb_imports,
+                        **adb_import_kwargs,
+                    )
 
-        bar_progress = get_bar_progress("(CUG → ADB): Edges", "#5E3108")
-        bar_progress_task = bar_progress.add_task("Edges", total=len(cug_edges))
+            #################
+            # cuGraph Edges #
+            #################
+
+            edge_batch_size = batch_size or max(len(cug_edges), 1)
+
+            # Homogeneous graphs skip the controller (and its validation) entirely
+            identify_cug_edge: Callable[
+                [CUGId, CUGId, Dict[CUGId, str], List[str]], str
+            ]
+            if has_one_e_col:
+                identify_cug_edge = self.__identify_cug_edge_of_one_col
+            else:
+                adb_e_col_set = frozenset(adb_e_cols)
+                identify_cug_edge = partial(
+                    self.__identify_cug_edge, adb_e_col_set=adb_e_col_set
+                )
 
-        with Live(Group(bar_progress, spinner_progress)):
-            for i in range(len(cug_edges)):
-                bar_progress.advance(bar_progress_task)
-
-                from_node_id = cug_edges[src_series_key][i]
-                to_node_id = cug_edges[dst_series_key][i]
-
-                # 1. Process cuGraph edge
-                self.__process_cug_edge(
-                    i,
-                    from_node_id,
-                    to_node_id,
-                    cug_map,
-                    adb_docs,
-                    adb_e_cols,
-                    has_one_e_col,
+            adb_e_table: Optional[pa.Table] = None
+            if is_default_cug_edge and adb_v_docs is not None:
+                adb_e_table = self.__get_default_adb_edges(
+                    cug_edges,
+                    cug_nodes,
+                    adb_v_docs,
+                    src_series_key,
+                    dst_series_key,
                     edge_attr,
-                    cug_edges[edge_attr] if edge_attr is not None else None,
+                ).to_arrow()
+
+            else:
+                # Pull each column off the GPU once, as Arrow, instead of once per edge
+                cug_src = cug_edges[src_series_key].to_arrow()
+                cug_dst = cug_edges[dst_series_key].to_arrow()
+                cug_weights = (
+                    cug_edges[edge_attr].to_arrow() if edge_attr is not None else None
                 )
 
-                # 2. Insert batch of edges
-                if i % edge_batch_size == 0:
+            bar_progress = get_bar_progress("(CUG → ADB): Edges", "#5E3108")
+            bar_progress_task = bar_progress.add_task("Edges", total=len(cug_edges))
+
+            with Live(Group(bar_progress, spinner_progress)):
+                for start in range(0, len(cug_edges), edge_batch_size):
+                    # 1. Process cuGraph edges
+                    if adb_e_table is not None:
+                        adb_e_batch = adb_e_table.slice(start, edge_batch_size)
+                        adb_docs[adb_e_cols[0]].extend(adb_e_batch.to_pylist())
+                        end = start + len(adb_e_batch)
+
+                    else:
+                        # Only the current batch is converted into Python objects
+                        from_node_ids = cug_src.slice(
+                            start, edge_batch_size
+                        ).to_pylist()
+                        to_node_ids = cug_dst.slice(start, edge_batch_size).to_pylist()
+                        weights = (
+                            cug_weights.slice(start, edge_batch_size).to_pylist()
+                            if cug_weights is not None
+                            else repeat(None)
+                        )
+
+                        edges = zip(from_node_ids, to_node_ids, weights)
+                        for i, (from_id, to_id, weight) in enumerate(edges, start):
+                            self.__process_cug_edge(
+                                i,
+                                from_id,
+                                to_id,
+                                cug_map,
+                                adb_docs,
+                                adb_e_cols,
+                                identify_cug_edge,
+                                edge_attr,
+                                weight,
+                            )
+
+                            if i % PROGRESS_UPDATE_INTERVAL == 0:
+                                bar_progress.update(bar_progress_task, completed=i)
+
+                        end = start + len(from_node_ids)
+
+                    bar_progress.update(bar_progress_task, completed=end)
+
+                    # 2. Insert batch of edges
                     self.__insert_adb_docs(
-                        spinner_progress, adb_docs, use_async, **adb_import_kwargs
+                        import_executor,
+                        spinner_progress,
+                        adb_docs,
+                        use_async,
+                        adb_imports,
+                        **adb_import_kwargs,
                     )
 
-            # Insert remaining edges
-            self.__insert_adb_docs(
-                spinner_progress, adb_docs, use_async, **adb_import_kwargs
-            )
+                # Keep the spinners of the remaining imports on screen
+                self.__wait_for_adb_imports(adb_imports)
 
         logger.info(f"Created ArangoDB '{name}' Graph")
         return adb_graph
@@ -442,162 +716,418 @@ class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
     # Private: ArangoDB -> cuGraph #
     ################################
 
+    def __process_adb_v_col(
+        self,
+        v_col: str,
+        adb_map: Dict[str, CUGId],
+        bar_progress: Progress,
+        spinner_progress: Progress,
+        **adb_export_kwargs: Any,
+    ) -> None:
+        """ArangoDB -> cuGraph: Fetches & processes an ArangoDB vertex collection.
+
+        :param v_col: The ArangoDB vertex collection.
+        :type v_col: str
+        :param adb_map: Maps ArangoDB vertex IDs to cuGraph node IDs.
+        :type adb_map: Dict[str, adbcug_adapter.typings.CUGId]
+        :param bar_progress: The bar progress shared by all vertex collections.
+        :type bar_progress: rich.progress.Progress
+        :param spinner_progress: The spinner progress shared by all vertex collections.
+        :type spinner_progress: rich.progress.Progress
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance.
+        :type adb_export_kwargs: Any
+        """
+        logger.debug(f"Preparing '{v_col}' vertices")
+
+        # 1. Fetch ArangoDB vertices
+        v_col_cursor, v_col_size = self.__fetch_adb_vertices(
+            spinner_progress, v_col, **adb_export_kwargs
+        )
+
+        # 2. Process ArangoDB vertices
+        self.__process_adb_cursor(
+            bar_progress,
+            v_col_cursor,
+            v_col_size,
+            self.__process_adb_vertices,
+            v_col,
+            adb_map,
+        )
+
+    def __process_adb_e_col(
+        self,
+        e_col: str,
+        bar_progress: Progress,
+        spinner_progress: Progress,
+        edge_attr: str,
+        **adb_export_kwargs: Any,
+    ) -> Dict[str, List[Any]]:
+        """ArangoDB -> cuGraph: Fetches & processes an ArangoDB edge collection.
+
+        Runs in a worker thread, so the results are returned instead of being
+        written into state shared with other collections.
+
+        :param e_col: The ArangoDB edge collection.
+        :type e_col: str
+        :param bar_progress: The bar progress shared by all edge collections.
+        :type bar_progress: rich.progress.Progress
+        :param spinner_progress: The spinner progress shared by all edge collections.
+        :type spinner_progress: rich.progress.Progress
+        :param edge_attr: The weight attribute name of your ArangoDB edges.
+        :type edge_attr: str
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance.
+        :type adb_export_kwargs: Any
+        :return: The cuGraph edges of **e_col**, stored by column.
+        :rtype: Dict[str, List[Any]]
+        """
+        logger.debug(f"Preparing '{e_col}' edges")
+
+        # 1. Fetch ArangoDB edges
+        e_col_cursor, e_col_size = self.__fetch_adb_edges(
+            spinner_progress, e_col, edge_attr, **adb_export_kwargs
+        )
+
+        # 2. Process ArangoDB edges
+        e_col_edges: Dict[str, List[Any]] = {"src": [], "dst": [], edge_attr: []}
+        self.__process_adb_cursor(
+            bar_progress,
+            e_col_cursor,
+            e_col_size,
+            self.__process_adb_edges,
+            e_col,
+            e_col_edges,
+            edge_attr,
+        )
+
+        return e_col_edges
+
+    def __fetch_adb_vertices(
+        self,
+        spinner_progress: Progress,
+        v_col: str,
+        **adb_export_kwargs: Any,
+    ) -> Tuple[Optional[Cursor], int]:
+        """ArangoDB -> cuGraph: Fetches the ArangoDB vertices within a collection.
+
+        :param spinner_progress: The spinner progress bar.
+        :type spinner_progress: rich.progress.Progress
+        :param v_col: The ArangoDB vertex collection.
+        :type v_col: str
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance.
+        :type adb_export_kwargs: Any
+        :return: The vertex cursor along with the total collection size.
+        :rtype: Tuple[arango.cursor.Cursor | None, int]
+        """
+        return self.__fetch_adb_docs(
+            spinner_progress,
+            v_col,
+            VERTEX_EXPORT_AQL,
+            {"@col": v_col},
+            **adb_export_kwargs,
+        )
+
+    def __fetch_adb_edges(
+        self,
+        spinner_progress: Progress,
+        e_col: str,
+        edge_attr: str,
+        **adb_export_kwargs: Any,
+    ) -> Tuple[Optional[Cursor], int]:
+        """ArangoDB -> cuGraph: Fetches the ArangoDB edges within a collection.
+
+        :param spinner_progress: The spinner progress bar.
+        :type spinner_progress: rich.progress.Progress
+        :param e_col: The ArangoDB edge collection.
+        :type e_col: str
+        :param edge_attr: The weight attribute name of your ArangoDB edges.
+        :type edge_attr: str
+        :param adb_export_kwargs: Keyword arguments to specify AQL query options when
+            fetching documents from the ArangoDB instance.
+        :type adb_export_kwargs: Any
+        :return: The edge cursor along with the total collection size.
+        :rtype: Tuple[arango.cursor.Cursor | None, int]
+        """
+        if not edge_attr:
+            return self.__fetch_adb_docs(
+                spinner_progress,
+                e_col,
+                EDGE_EXPORT_AQL,
+                {"@col": e_col},
+                **adb_export_kwargs,
+            )
+
+        return self.__fetch_adb_docs(
+            spinner_progress,
+            e_col,
+            WEIGHTED_EDGE_EXPORT_AQL,
+            {"@col": e_col, "attr": edge_attr},
+            **adb_export_kwargs,
+        )
+
     def __fetch_adb_docs(
         self,
+        spinner_progress: Progress,
         col: str,
-        is_edge: bool,
-        edge_attr: Optional[str],
+        aql: str,
+        bind_vars: Dict[str, Any],
         **adb_export_kwargs: Any,
-    ) -> Tuple[Cursor, int]:
+    ) -> Tuple[Optional[Cursor], int]:
         """ArangoDB -> cuGraph: Fetches ArangoDB documents within a collection.
 
+        :param spinner_progress: The spinner progress bar.
+        :type spinner_progress: rich.progress.Progress
         :param col: The ArangoDB collection.
         :type col: str
-        :param is_edge: True if **col** is an edge collection.
-        :type is_edge: bool
-        :param edge_attr: The weight attribute name of your ArangoDB edges.
-        :type edge_attr: str | None
+        :param aql: The AQL export query of **col**.
+        :type aql: str
+        :param bind_vars: The bind parameters of **aql**.
+        :type bind_vars: Dict[str, Any]
         :param adb_export_kwargs: Keyword arguments to specify AQL query options when
             fetching documents from the ArangoDB instance.
         :type adb_export_kwargs: Any
-        :return: The document cursor along with the total collection size.
-        :rtype: Tuple[arango.cursor.Cursor, int]
+        :return: The document cursor (None if **col** is empty) along with the
+            total collection size.
+        :rtype: Tuple[arango.cursor.Cursor | None, int]
         """
-        keys = ["_id"]
-        keys += ["_from", "_to"] if is_edge else []
-        keys += [edge_attr] if is_edge and edge_attr else []
-        aql_return_value = f"KEEP(doc, {keys})"
-
         col_size: int = self.__db.collection(col).count()
 
-        with get_export_spinner_progress(f"ADB Export: '{col}' ({col_size})") as p:
-            p.add_task(col)
+        # Spare the query round trip(s) for empty collections
+        if col_size == 0:
+            logger.debug(f"Skipping empty collection '{col}'")
+            return None, 0
+
+        action = f"ADB Export: '{col}' ({col_size})"
+        spinner_progress_task = spinner_progress.add_task("", action=action)
+
+        cursor: Cursor = self.__db.aql.execute(
+            aql,
+            bind_vars=bind_vars,
+            **{
+                "batch_size": DEFAULT_ADB_EXPORT_BATCH_SIZE,
+                **adb_export_kwargs,
+                "stream": True,
+            },
+        )
 
-            cursor: Cursor = self.__db.aql.execute(
-                f"FOR doc IN @@col RETURN {aql_return_value}",
-                bind_vars={"@col": col},
-                **{**adb_export_kwargs, **{"stream": True}},
-            )
+        spinner_progress.stop_task(spinner_progress_task)
+        spinner_progress.update(spinner_progress_task, visible=False)
 
-            return cursor, col_size
+        return cursor, col_size
 
     def __process_adb_cursor(
         self,
-        progress_color: str,
-        cursor: Cursor,
+        progress: Progress,
+        cursor: Optional[Cursor],
         col_size: int,
-        process_adb_doc: Callable[..., None],
+        process_adb_batch: Callable[..., None],
         col: str,
-        adb_map: Dict[str, CUGId],
         *args: Any,
     ) -> None:
         """ArangoDB -> cuGraph: Processes the ArangoDB Cursors for vertices and edges.
 
-        :param progress_color: The progress bar color.
-        :type progress_color: str
-        :param cursor: The ArangoDB cursor for the current **col**.
-        :type cursor: arango.cursor.Cursor
-        :param process_adb_doc: The function to process the cursor data.
-        :type process_adb_doc: Callable
+        :param progress: The bar progress, shared with other collections.
+        :type progress: rich.progress.Progress
+        :param cursor: The ArangoDB cursor for the current **col**
+            (None if **col** is empty).
+        :type cursor: arango.cursor.Cursor | None
+        :param process_adb_batch: The function to process a batch of cursor data.
+        :type process_adb_batch: Callable
         :param col: The ArangoDB collection for the current **cursor**.
         :type col: str
         :param col_size: The size of **col**.
         :type col_size: int
-        :param adb_map: Maps ArangoDB vertex IDs to cuGraph node IDs.
-        :type adb_map: Dict[str, adbcug_adapter.typings.CUGId]
+        :param args: Additional arguments passed to **process_adb_batch**.
+        :type args: Any
         """
 
-        progress = get_bar_progress(f"(ADB → CUG): '{col}'", progress_color)
         progress_task_id = progress.add_task(col, total=col_size)
 
-        with Live(Group(progress)):
-            while not cursor.empty():
-                for doc in cursor.batch():
-                    progress.advance(progress_task_id)
+        if cursor is None:
+            return
+
+        for batch in self.__iterate_adb_cursor(cursor):
+            process_adb_batch(batch, col, *args)
+            progress.advance(progress_task_id, len(batch))
 
-                    process_adb_doc(doc, col, adb_map, *args)
+    def __iterate_adb_cursor(self, cursor: Cursor) -> Iterator[List[Json]]:
+        """ArangoDB -> cuGraph: Iterates over the batches of an ArangoDB Cursor.
 
+        The next batch is fetched in the background while the current
+        batch is being processed, hiding the network round trip.
+
+        :param cursor: The ArangoDB cursor.
+        :type cursor: arango.cursor.Cursor
+        :return: The batches of documents.
+        :rtype: Iterator[List[Dict[str, Any]]]
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while True:
+                # Cursor.fetch() appends to the cursor's batch, so the
+                # current batch is moved out before the next one is fetched
+                batch = list(cursor.batch())
                 cursor.batch().clear()
-                if cursor.has_more():
-                    cursor.fetch()
 
-    def __process_adb_vertex(
+                next_batch = (
+                    executor.submit(cursor.fetch) if cursor.has_more() else None
+                )
+
+                if batch:
+                    yield batch
+
+                if next_batch is None:
+                    break
+
+                next_batch.result()
+
+    def __process_adb_vertices(
         self,
-        adb_v: Json,
+        adb_vertices: List[Json],
         v_col: str,
         adb_map: Dict[str, CUGId],
     ) -> None:
-        """ArangoDB -> cuGraph: Processes an ArangoDB vertex.
+        """ArangoDB -> cuGraph: Processes a batch of ArangoDB vertices.
 
-        :param adb_v: The ArangoDB vertex.
-        :type adb_v: Dict[str, Any]
+        :param adb_vertices: The ArangoDB vertices.
+        :type adb_vertices: List[Dict[str, Any]]
         :param v_col: The ArangoDB vertex collection.
         :type v_col: str
         :param adb_map: Maps ArangoDB vertex IDs to cuGraph node IDs.
         :type adb_map: Dict[str, adbcug_adapter.typings.CUGId]
         """
-        if not self.__prepare_adb_vertex_method_is_empty:
-            adb_id: str = adb_v["_id"]
-            self.__cntrl._prepare_arangodb_vertex(adb_v, v_col)
-            cug_id: str = adb_v["_id"]
+        prepare_adb_vertex = self.__cntrl._prepare_arangodb_vertex
+
+        adb_ids: List[str] = list(map(itemgetter("_id"), adb_vertices))
+        for adb_v in adb_vertices:
+            prepare_adb_vertex(adb_v, v_col)
 
-            if adb_id != cug_id:
-                adb_map[adb_id] = cug_id
+        adb_map.update(
+            (adb_id, adb_v["_id"])
+            for adb_id, adb_v in zip(adb_ids, adb_vertices)
+            if adb_id != adb_v["_id"]
+        )
 
-    def __process_adb_edge(
+    def __process_adb_edges(
         self,
-        adb_e: Json,
+        adb_edges: List[List[Any]],
         e_col: str,
-        adb_map: Dict[str, CUGId],
-        cug_edges: List[Tuple[CUGId, CUGId, Any]],
+        cug_edges: Dict[str, List[Any]],
         edge_attr: str,
-        default_edge_attr_value: int,
     ) -> None:
-        """ArangoDB -> cuGraph: Processes an ArangoDB edge.
+        """ArangoDB -> cuGraph: Processes a batch of ArangoDB edges.
 
-        :param adb_e: The ArangoDB edge.
-        :type adb_e: Dict[str, Any]
+        :param adb_edges: The ArangoDB edges, as [_from, _to, **edge_attr**] rows
+            (without **edge_attr** if no weight attribute was exported).
+        :type adb_edges: List[List[Any]]
         :param e_col: The ArangoDB edge collection.
         :type e_col: str
-        :param adb_map: Maps ArangoDB vertex IDs to cuGraph node IDs.
-        :type adb_map: Dict[str, adbcug_adapter.typings.CUGId]
-        :param cug_edges: To-be-inserted cuGraph edges.
-        :type cug_edges: List[Tuple[CUGId, CUGId, Any]]
+        :param cug_edges: To-be-inserted cuGraph edges, stored by column
+            (src & dst as Arrow chunks, one per batch).
+        :type cug_edges: Dict[str, List[Any]]
         :param edge_attr: The weight attribute name of your ArangoDB edges.
         :type edge_attr: str
-        :param default_edge_attr_value: The default value set to the edge attribute
-            if **edge_attr** is not present in the ArangoDB edge. Defaults to 0.
-        :type default_edge_attr_value: int
         """
-        from_node_id: CUGId = adb_map.get(adb_e["_from"], adb_e["_from"])
-        to_node_id: CUGId = adb_map.get(adb_e["_to"], adb_e["_to"])
-
-        cug_edges.append(
-            (
-                from_node_id,
-                to_node_id,
-                adb_e.get(edge_attr, default_edge_attr_value),
-            )
+        # Transpose the batch's rows into columns
+        adb_columns = list(zip(*adb_edges))
+
+        # Endpoints are kept as one Arrow string array per batch, rather than as
+        # one Python str per edge until the whole graph has been fetched.
+        # ArangoDB IDs are mapped to cuGraph IDs later, in __create_cug_graph
+        cug_edges["src"].append(pa.array(adb_columns[0], pa.string()))
+        cug_edges["dst"].append(pa.array(adb_columns[1], pa.string()))
+
+        # The AQL projection returns null for edges missing **edge_attr**,
+        # which are given their default value later, in __create_cug_graph
+        weights = (
+            adb_columns[2] if len(adb_columns) > 2 else repeat(None, len(adb_edges))
         )
+        cug_edges[edge_attr].extend(weights)
 
     def __create_cug_graph(
         self,
         cug_graph: Optional[CUGMultiGraph],
-        cug_edges: List[Tuple[CUGId, CUGId, Any]],
+        cug_edges: List[Dict[str, List[Any]]],
+        adb_map: Dict[str, CUGId],
         edge_attr: str,
+        default_edge_attr_value: int,
+        weight_dtype: Optional[str],
     ) -> CUGMultiGraph:
         """AragoDB -> cuGraph: Creates the cuGraph graph.
 
         :param cug_graph: An existing cuGraph graph.
         :type cug_graph: cugraph.classes.graph.Graph | None
-        :param cug_edges: To-be-inserted cuGraph edges.
-        :type cug_edges: List[Tuple[CUGId, CUGId, Any]]
+        :param cug_edges: To-be-inserted cuGraph edges of each edge collection,
+            stored by column (src & dst as Arrow chunks, one per batch).
+        :type cug_edges: List[Dict[str, List[Any]]]
+        :param adb_map: Maps ArangoDB vertex IDs to cuGraph node IDs.
+        :type adb_map: Dict[str, adbcug_adapter.typings.CUGId]
         :param edge_attr: The weight attribute name of your ArangoDB edges.
         :type edge_attr: str
+        :param default_edge_attr_value: The default value set to the edge attribute
+            if **edge_attr** is missing (or null) in the ArangoDB edge.
+        :type default_edge_attr_value: int
+        :param weight_dtype: The type to cast the edge weights to, if any.
+        :type weight_dtype: str | None
         :return: A Multi-Directed cuGraph Graph.
         :rtype: cugraph.structure.graph_classes.MultiDiGraph
         """
-        df = DataFrame(cug_edges, columns=["src", "dst", edge_attr])
+        num_edges = sum(len(e_col_edges[edge_attr]) for e_col_edges in cug_edges)
+
+        # Each column is gathered into one contiguous Arrow buffer, allocated
+        # once at its final size, so cuDF copies it to the device in one go
+        columns = {
+            k: pa.chunked_array(
+                [chunk for e_col_edges in cug_edges for chunk in e_col_edges[k]],
+                pa.string(),
+            ).combine_chunks()
+            for k in ["src", "dst"]
+        }
+
+        columns[edge_attr] = pa.array(
+            chain.from_iterable(e_col_edges[edge_attr] for e_col_edges in cug_edges),
+            size=num_edges,
+        )
+
+        # A column without any weight only holds the default value, so it is
+        # filled in on the GPU rather than built on the host & copied over
+        has_weights = columns[edge_attr].type != pa.null()
+        if not has_weights:
+            del columns[edge_attr]
+        elif weight_dtype is not None:
+            # Cast on the host, so that the narrower weights are what gets copied.
+            # An unsafe cast lets e.g large int64 weights lose float32 precision
+            # instead of raising
+            columns[edge_attr] = columns[edge_attr].cast(weight_dtype, safe=False)
+
+        # Node IDs repeat across edges, so only send each distinct ID to the
+        # device once, along with the int32 codes of every edge endpoint
+        for k in ["src", "dst"]:
+            # Only vertices re-identified by the controller are stored in
+            # **adb_map**, so an empty map means every ArangoDB ID is also its
+            # cuGraph ID. Otherwise, each distinct ID is only looked up once.
+            if adb_map:
+                encoded = columns[k].dictionary_encode()
+                adb_ids = encoded.dictionary.to_pylist()
+                cug_ids = pa.array(
+                    map(adb_map.get, adb_ids, adb_ids), size=len(adb_ids)
+                )
+                columns[k] = cug_ids.take(encoded.indices)
+
+            columns[k] = columns[k].dictionary_encode()
+
+        df = DataFrame.from_arrow(pa.table(columns))
+        for k in ["src", "dst"]:
+            df[k] = df[k].astype(df[k].cat.categories.dtype)
+
+        # Fill in missing weights on the GPU, rather than once per edge in Python
+        if has_weights:
+            df[edge_attr] = df[edge_attr].fillna(default_edge_attr_value)
+        else:
+            df[edge_attr] = default_edge_attr_value
+            if weight_dtype is not None:
+                df[edge_attr] = df[edge_attr].astype(weight_dtype)
 
         cug_graph = cug_graph or CUGMultiGraph(directed=True)
         cug_graph.from_cudf_edgelist(
@@ -627,7 +1157,7 @@ class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
         :raise ValueError: If edge_attr is not present in the cuGraph edge list.
             Or if the graph is not weighted but edge_attr is not None.
         """
-        cug_nodes = cug_graph.nodes().values_host
+        cug_nodes: Series = cug_graph.nodes()
         cug_edges: DataFrame = cug_graph.view_edge_list()
 
         is_weighted = cug_graph.is_weighted()
@@ -678,6 +1208,73 @@ class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
                 orphan_collections,
             )
 
+    def __get_default_adb_vertices(self, cug_nodes: Series, v_col: str) -> DataFrame:
+        """cuGraph -> ArangoDB: Builds the ArangoDB vertices of a homogeneous graph
+        on the GPU, keyed by node index (i.e the default controller behaviour).
+
+        :param cug_nodes: The cuGraph nodes.
+        :type cug_nodes: cudf.Series
+        :param v_col: The ArangoDB vertex collection.
+        :type v_col: str
+        :return: The ArangoDB vertices, as an _id & _key DataFrame
+            (in the order of **cug_nodes**).
+        :rtype: cudf.DataFrame
+        """
+        keys = Series(range(1, len(cug_nodes) + 1)).astype("str")
+        return DataFrame({"_id": keys.str.insert(0, f"{v_col}/"), "_key": keys})
+
+    def __get_default_adb_edges(
+        self,
+        cug_edges: DataFrame,
+        cug_nodes: Series,
+        adb_vertices: DataFrame,
+        src_series_key: str,
+        dst_series_key: str,
+        edge_attr: Optional[str],
+    ) -> DataFrame:
+        """cuGraph -> ArangoDB: Builds the ArangoDB edges of a homogeneous graph
+        on the GPU, keyed by edge index (i.e the default controller behaviour).
+
+        :param cug_edges: The cuGraph edge list.
+        :type cug_edges: cudf.DataFrame
+        :param cug_nodes: The cuGraph nodes.
+        :type cug_nodes: cudf.Series
+        :param adb_vertices: The ArangoDB vertices of **cug_nodes**.
+        :type adb_vertices: cudf.DataFrame
+        :param src_series_key: The cuGraph edge list source series key.
+        :type src_series_key: str
+        :param dst_series_key: The cuGraph edge list destination series key.
+        :type dst_series_key: str
+        :param edge_attr: The weight attribute name of the cuGraph edges.
+        :type edge_attr: str | None
+        :return: The ArangoDB edges, as a _key, _from, _to (& **edge_attr**)
+            DataFrame.
+        :rtype: cudf.DataFrame
+        """
+        adb_edges = DataFrame(
+            {"_key": Series(range(len(cug_edges))).astype("str")},
+        )
+        adb_edges["cug_src"] = cug_edges[src_series_key].reset_index(drop=True)
+        adb_edges["cug_dst"] = cug_edges[dst_series_key].reset_index(drop=True)
+        if edge_attr is not None:
+            adb_edges[edge_attr] = cug_edges[edge_attr].reset_index(drop=True)
+
+        # Resolve every edge endpoint to its ArangoDB ID with a join
+        adb_ids = DataFrame(
+            {"cug_id": cug_nodes.reset_index(drop=True), "adb_id": adb_vertices["_id"]}
+        )
+        for cug_k, adb_k in [("cug_src", "_from"), ("cug_dst", "_to")]:
+            adb_edges = adb_edges.merge(
+                adb_ids.rename(columns={"cug_id": cug_k, "adb_id": adb_k}),
+                on=cug_k,
+                how="left",
+            )
+
+        columns = ["_key", "_from", "_to"] + (
+            [edge_attr] if edge_attr is not None else []
+        )
+        return adb_edges[columns]
+
     def __process_cug_node(
         self,
         i: int,
@@ -685,7 +1282,7 @@ class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
         cug_map: Dict[CUGId, str],
         adb_docs: DefaultDict[str, List[Json]],
         adb_v_cols: List[str],
-        has_one_v_col: bool,
+        identify_cug_node: Callable[[CUGId, List[str]], str],
     ) -> None:
         """cuGraph -> ArangoDB: Processes a cuGraph node.
 
@@ -699,23 +1296,22 @@ class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
         :type adb_docs: DefaultDict[str, List[Dict[str, Any]]]
         :param adb_v_cols: The ArangoDB vertex collections.
         :type adb_v_cols: List[str]
-        :param has_one_v_col: True if the Graph has one Vertex collection.
-        :type has_one_v_col: bool
+        :param identify_cug_node: Returns the ArangoDB vertex collection
+            of a cuGraph node.
+        :type identify_cug_node: Callable[[adbcug_adapter.typings.CUGId,
+            List[str]], str]
         """
-        logger.debug(f"N{i}: {cug_id}")
-
-        col = (
-            adb_v_cols[0]
-            if has_one_v_col
-            else self.__cntrl._identify_cugraph_node(cug_id, adb_v_cols)
+        # Lazily formatted, as this runs for every node
+        logger.debug("N%s: %s", i, cug_id)
+
+        col = identify_cug_node(cug_id, adb_v_cols)
+        # The default controller keys nodes by their index
+        key = (
+            str(i)
+            if self.__keyify_cug_node_method_is_default
+            else self.__cntrl._keyify_cugraph_node(i, cug_id, col)
         )
 
-        if not has_one_v_col and col not in adb_v_cols:
-            msg = f"'{cug_id}' identified as '{col}', which is not in {adb_v_cols}"
-            raise ValueError(msg)
-
-        key = self.__cntrl._keyify_cugraph_node(i, cug_id, col)
-
         adb_id = f"{col}/{key}"
         cug_node = {"_id": adb_id, "_key": key}
 
@@ -732,9 +1328,9 @@ class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
         cug_map: Dict[CUGId, str],
         adb_docs: DefaultDict[str, List[Json]],
         adb_e_cols: List[str],
-        has_one_e_col: bool,
+        identify_cug_edge: Callable[[CUGId, CUGId, Dict[CUGId, str], List[str]], str],
         edge_attr: Optional[str],
-        cug_weights: Optional[Series],
+        weight: Any,
     ) -> None:
         """cuGraph -> ArangoDB: Processes a cuGraph edge.
 
@@ -750,82 +1346,280 @@ class ADBCUG_Adapter(Abstract_ADBCUG_Adapter):
         :type adb_docs: DefaultDict[str, List[Dict[str, Any]]]
         :param adb_e_cols: The ArangoDB edge collections.
         :type adb_e_cols: List[str]
-        :param has_one_e_col: True if the Graph has one Edge collection.
-        :type has_one_e_col: bool
+        :param identify_cug_edge: Returns the ArangoDB edge collection
+            of a cuGraph edge.
+        :type identify_cug_edge: Callable[[adbcug_adapter.typings.CUGId,
+            adbcug_adapter.typings.CUGId, Dict[adbcug_adapter.typings.CUGId, str],
+            List[str]], str]
         :param edge_attr: The weight attribute name of your ArangoDB edges.
         :type edge_attr: str
-        :param cug_weights: The cuGraph edge weights (if graph is weighted).
-        :type cug_weights: Optional[cudf.Series]
+        :param weight: The cuGraph edge weight (None if not exported).
+        :type weight: Any
         """
-        edge_str = f"({from_node_id}, {to_node_id})"
-        logger.debug(f"E{i}: {edge_str}")
-
-        col = (
-            adb_e_cols[0]
-            if has_one_e_col
-            else self.__cntrl._identify_cugraph_edge(
-                from_node_id, to_node_id, cug_map, adb_e_cols
+        # Lazily formatted, as this runs for every edge
+        logger.debug("E%s: (%s, %s)", i, from_node_id, to_node_id)
+
+        col = identify_cug_edge(from_node_id, to_node_id, cug_map, adb_e_cols)
+        # The default controller keys edges by their index
+        key = (
+            str(i)
+            if self.__keyify_cug_edge_method_is_default
+            else self.__cntrl._keyify_cugraph_edge(
+                i, from_node_id, to_node_id, cug_map, col
             )
         )
 
-        if not has_one_e_col and col not in adb_e_cols:
-            msg = f"{edge_str} identified as '{col}', which is not in {adb_e_cols}"
-            raise ValueError(msg)
-
-        key = self.__cntrl._keyify_cugraph_edge(
-            i, from_node_id, to_node_id, cug_map, col
-        )
-
         cug_edge = {
             "_key": key,
             "_from": cug_map[from_node_id],
             "_to": cug_map[to_node_id],
         }
 
-        if cug_weights is not None:
-            cug_edge[edge_attr] = cug_weights[i].item()  # type:ignore # false positive
+        if edge_attr is not None:
+            cug_edge[edge_attr] = weight
 
         self.__cntrl._prepare_cugraph_edge(cug_edge, col)
         adb_docs[col].append(cug_edge)
 
+    def __identify_cug_node_of_one_col(
+        self, cug_id: CUGId, adb_v_cols: List[str]
+    ) -> str:
+        """cuGraph -> ArangoDB: Identifies the vertex collection of a cuGraph node,
+        when the ArangoDB graph has only one.
+
+        :param cug_id: The cuGraph node ID.
+        :type cug_id: adbcug_adapter.typings.CUGId
+        :param adb_v_cols: The ArangoDB vertex collections.
+        :type adb_v_cols: List[str]
+        :return: The ArangoDB vertex collection.
+        :rtype: str
+        """
+        return adb_v_cols[0]
+
+    def __identify_cug_node(
+        self, cug_id: CUGId, adb_v_cols: List[str], adb_v_col_set: FrozenSet[str]
+    ) -> str:
+        """cuGraph -> ArangoDB: Identifies the vertex collection of a cuGraph node
+        through the controller.
+
+        :param cug_id: The cuGraph node ID.
+        :type cug_id: adbcug_adapter.typings.CUGId
+        :param adb_v_cols: The ArangoDB vertex collections.
+        :type adb_v_cols: List[str]
+        :param adb_v_col_set: **adb_v_cols**, for constant-time membership checks.
+        :type adb_v_col_set: FrozenSet[str]
+        :return: The ArangoDB vertex collection.
+        :rtype: str
+        :raise ValueError: If the controller returns an unknown collection
+        """
+        col = self.__cntrl._identify_cugraph_node(cug_id, adb_v_cols)
+
+        if col not in adb_v_col_set:
+            msg = f"'{cug_id}' identified as '{col}', which is not in {adb_v_cols}"
+            raise ValueError(msg)
+
+        return col
+
+    def __identify_cug_edge_of_one_col(
+        self,
+        from_node_id: CUGId,
+        to_node_id: CUGId,
+        cug_map: Dict[CUGId, str],
+        adb_e_cols: List[str],
+    ) -> str:
+        """cuGraph -> ArangoDB: Identifies the edge collection of a cuGraph edge,
+        when the ArangoDB graph has only one.
+
+        :param from_node_id: The cuGraph ID of the source node.
+        :type from_node_id: adbcug_adapter.typings.CUGId
+        :param to_node_id: The cuGraph ID of the target node.
+        :type to_node_id: adbcug_adapter.typings.CUGId
+        :param cug_map: Maps cuGraph node IDs to ArangoDB vertex IDs.
+        :type cug_map: Dict[adbcug_adapter.typings.CUGId, str]
+        :param adb_e_cols: The ArangoDB edge collections.
+        :type adb_e_cols: List[str]
+        :return: The ArangoDB edge collection.
+        :rtype: str
+        """
+        return adb_e_cols[0]
+
+    def __identify_cug_edge(
+        self,
+        from_node_id: CUGId,
+        to_node_id: CUGId,
+        cug_map: Dict[CUGId, str],
+        adb_e_cols: List[str],
+        adb_e_col_set: FrozenSet[str],
+    ) -> str:
+        """cuGraph -> ArangoDB: Identifies the edge collection of a cuGraph edge
+        through the controller.
+
+        :param from_node_id: The cuGraph ID of the source node.
+        :type from_node_id: adbcug_adapter.typings.CUGId
+        :param to_node_id: The cuGraph ID of the target node.
+        :type to_node_id: adbcug_adapter.typings.CUGId
+        :param cug_map: Maps cuGraph node IDs to ArangoDB vertex IDs.
+        :type cug_map: Dict[adbcug_adapter.typings.CUGId, str]
+        :param adb_e_cols: The ArangoDB edge collections.
+        :type adb_e_cols: List[str]
+        :param adb_e_col_set: **adb_e_cols**, for constant-time membership checks.
+        :type adb_e_col_set: FrozenSet[str]
+        :return: The ArangoDB edge collection.
+        :rtype: str
+        :raise ValueError: If the controller returns an unknown collection
+        """
+        col = self.__cntrl._identify_cugraph_edge(
+            from_node_id, to_node_id, cug_map, adb_e_cols
+        )
+
+        if col not in adb_e_col_set:
+            edge_str = f"({from_node_id}, {to_node_id})"
+            msg = f"{edge_str} identified as '{col}', which is not in {adb_e_cols}"
+            raise ValueError(msg)
+
+        return col
+
     def __insert_adb_docs(
         self,
+        import_executor: ThreadPoolExecutor,
         spinner_progress: Progress,
         adb_docs: DefaultDict[str, List[Json]],
         use_async: bool,
+        adb_imports: Dict[str, Future[List[Json]]],
         **adb_import_kwargs: Any,
     ) -> None:
         """cuGraph -> ArangoDB: Insert the ArangoDB documents.
 
+        Each collection is imported into on **import_executor**, so that the
+        next batch is built while the previous one is still being sent. A
+        collection only has one batch in flight at once, which keeps its
+        imports in order.
+
+        :param import_executor: The thread pool running the imports.
+        :type import_executor: concurrent.futures.ThreadPoolExecutor
         :param spinner_progress: The spinner progress bar.
         :type spinner_progress: rich.progress.Progress
         :param adb_docs: To-be-inserted ArangoDB documents
         :type adb_docs: DefaultDict[str, List[Json]]
         :param use_async: Performs asynchronous ArangoDB ingestion if enabled.
         :type use_async: bool
+        :param adb_imports: The pending ArangoDB import of each collection.
+        :type adb_imports: Dict[str, concurrent.futures.Future]
         :param adb_import_kwargs: Keyword arguments to specify additional
             parameters for ArangoDB document insertion. Full parameter list:
             https://docs.python-arango.com/en/main/specs.html#arango.collection.Collection.import_bulk
         :param adb_import_kwargs: Any
         """
-        if len(adb_docs) == 0:
-            return
-
         db = self.__async_db if use_async else self.__db
 
-        # Avoiding "RuntimeError: dictionary changed size during iteration"
-        adb_cols = list(adb_docs.keys())
+        while adb_docs:
+            col, doc_list = adb_docs.popitem()
 
-        for col in adb_cols:
-            doc_list = adb_docs[col]
+            # Wait for the previous batch of **col** to be imported
+            if col in adb_imports:
+                self.__wait_for_adb_imports({col: adb_imports.pop(col)})
 
             action = f"ADB Import: '{col}' ({len(doc_list)})"
             spinner_progress_task = spinner_progress.add_task("", action=action)
 
-            result = db.collection(col).import_bulk(doc_list, **adb_import_kwargs)
-            logger.debug(result)
+            adb_imports[col] = import_executor.submit(
+                self.__import_adb_docs,
+                spinner_progress,
+                spinner_progress_task,
+                db.collection(col),
+                doc_list,
+                use_async,
+                **adb_import_kwargs,
+            )
 
-            del adb_docs[col]
+    def __import_adb_docs(
+        self,
+        spinner_progress: Progress,
+        spinner_progress_task: TaskID,
+        adb_col: StandardCollection,
+        doc_list: List[Json],
+        use_async: bool,
+        **adb_import_kwargs: Any,
+    ) -> List[Json]:
+        """cuGraph -> ArangoDB: Imports a batch of documents into a collection.
+
+        Synchronous imports send the batch as a single request. Asynchronous
+        imports split it into jobs of at most MAX_ADB_IMPORT_SIZE documents,
+        which ArangoDB runs concurrently. This is skipped with **overwrite**,
+        as each job would empty the collection.
 
+        :param spinner_progress: The spinner progress bar.
+        :type spinner_progress: rich.progress.Progress
+        :param spinner_progress_task: The spinner task of this import.
+        :type spinner_progress_task: rich.progress.TaskID
+        :param adb_col: The ArangoDB collection.
+        :type adb_col: arango.collection.StandardCollection
+        :param doc_list: To-be-inserted ArangoDB documents of **adb_col**.
+        :type doc_list: List[Dict[str, Any]]
+        :param use_async: Whether **adb_col** belongs to an asynchronous database.
+        :type use_async: bool
+        :param adb_import_kwargs: Keyword arguments to specify additional
+            parameters for ArangoDB document insertion.
+        :type adb_import_kwargs: Any
+        :return: The result of each import request.
+        :rtype: List[Dict[str, Any]]
+        """
+        try:
+            # Only asynchronous jobs run concurrently, so only they are worth
+            # splitting. Overwriting empties the collection first though, so it
+            # must be done in a single request to keep every document
+            import_size = (
+                MAX_ADB_IMPORT_SIZE
+                if use_async and not adb_import_kwargs.get("overwrite")
+                else max(len(doc_list), 1)
+            )
+
+            results = [
+                adb_col.import_bulk(
+                    doc_list[start : start + import_size], **adb_import_kwargs
+                )
+                for start in range(0, len(doc_list), import_size)
+            ]
+
+            return [
+                self.__wait_for_adb_job(result)
+                if isinstance(result, AsyncJob)
+                else result
+                for result in results
+            ]
+
+        finally:
             spinner_progress.stop_task(spinner_progress_task)
             spinner_progress.update(spinner_progress_task, visible=False)
+
+    def __wait_for_adb_job(self, adb_job: AsyncJob[Json]) -> Json:
+        """cuGraph -> ArangoDB: Wait for an asynchronous ArangoDB import.
+
+        :param adb_job: The ArangoDB import job.
+        :type adb_job: arango.job.AsyncJob
+        :return: The import result.
+        :rtype: Dict[str, Any]
+        :raise arango.exceptions.DocumentInsertError: If the import failed.
+        """
+        poll_interval = MIN_ADB_JOB_POLL_INTERVAL
+        while adb_job.status() != "done":
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, MAX_ADB_JOB_POLL_INTERVAL)
+
+        result: Json = adb_job.result()
+        return result
+
+    def __wait_for_adb_imports(
+        self, adb_imports: Dict[str, Future[List[Json]]]
+    ) -> None:
+        """cuGraph -> ArangoDB: Wait for the pending ArangoDB imports.
+
+        :param adb_imports: The pending ArangoDB import of each collection.
+        :type adb_imports: Dict[str, concurrent.futures.Future]
+        :raise arango.exceptions.DocumentInsertError: If an import failed.
+        """
+        for adb_import in adb_imports.values():
+            for result in adb_import.result():
+                logger.debug(result)
+
+        adb_imports.clear()
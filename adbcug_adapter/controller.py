@@ -188,9 +188,5 @@ class ADBCUG_Controller(Abstract_ADBCUG_Controller):
         :return: A valid ArangoDB _key value.
         :rtype: str
         """
-        res: str = ""
-        for s in string:
-            if s.isalnum() or s in self.VALID_KEY_CHARS:
-                res += s
-
-        return res
+        valid_key_chars = self.VALID_KEY_CHARS
+        return "".join([s for s in string if s.isalnum() or s in valid_key_chars])
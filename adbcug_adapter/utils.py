@@ -1,6 +1,8 @@
 import logging
 import os
+from typing import Optional
 
+import rmm
 from rich.progress import (
     BarColumn,
     Progress,
@@ -20,11 +22,10 @@ handler.setFormatter(formatter)
 logger.addHandler(handler)
 
 
-def get_export_spinner_progress(
-    text: str,
-) -> Progress:
+def get_export_spinner_progress(text: str) -> Progress:
     return Progress(
         TextColumn(text),
+        TextColumn("{task.fields[action]}"),
         SpinnerColumn("aesthetic", "#5BC0DE"),
         TimeElapsedColumn(),
         transient=True,
@@ -49,3 +50,29 @@ def get_bar_progress(text: str, color: str) -> Progress:
         TextColumn("({task.completed}/{task.total})"),
         TimeElapsedColumn(),
     )
+
+
+def set_rmm_pool(init_size: int, max_size: Optional[int]) -> None:
+    """Serves the GPU allocations of the current device from an RMM pool.
+
+    The memory resource is global to the device, so it is only replaced if
+    it is still RMM's default (i.e not configured by the user already).
+
+    :param init_size: The initial size of the pool, in bytes.
+    :type init_size: int
+    :param max_size: The maximum size of the pool, in bytes.
+    :type max_size: int | None
+    """
+    current_mr = rmm.mr.get_current_device_resource()
+    if type(current_mr) is not rmm.mr.CudaMemoryResource:
+        logger.debug(f"Keeping the current RMM memory resource: {current_mr}")
+        return
+
+    pool_mr = rmm.mr.PoolMemoryResource(
+        current_mr,
+        initial_pool_size=init_size,
+        maximum_pool_size=max_size,
+    )
+
+    rmm.mr.set_current_device_resource(pool_mr)
+    logger.debug(f"Set RMM pool memory resource ({init_size} bytes)")
@@ -1,6 +1,7 @@
 from typing import Any, Dict, List, Optional, Set
 
 import pytest
+import rmm
 from arango.graph import Graph as ADBGraph
 from cugraph import Graph as CUGGraph
 from cugraph import MultiGraph as CUGMultiGraph
@@ -33,6 +34,23 @@ def test_validate_constructor() -> None:
         ADBCUG_Adapter(db, Bad_ADBCUG_Controller())  # type: ignore
 
 
+def test_rmm_pool() -> None:
+    current_mr = rmm.mr.get_current_device_resource()
+
+    try:
+        rmm.mr.set_current_device_resource(rmm.mr.CudaMemoryResource())
+        ADBCUG_Adapter(db, rmm_pool_init_size=2**28)
+
+        pool_mr = rmm.mr.get_current_device_resource()
+        assert isinstance(pool_mr, rmm.mr.PoolMemoryResource)
+
+        # An RMM memory resource set beforehand is kept as is
+        ADBCUG_Adapter(db, rmm_pool_init_size=2**28)
+        assert rmm.mr.get_current_device_resource() is pool_mr
+    finally:
+        rmm.mr.set_current_device_resource(current_mr)
+
+
 @pytest.mark.parametrize(
     "adapter, name, metagraph",
     [
@@ -78,6 +96,106 @@ def test_adb_to_cug(
     assert_cugraph_data(cug_g, metagraph)
 
 
+def test_adb_to_cug_invalid_metagraph() -> None:
+    with pytest.raises(ValueError):
+        adbcug_adapter.arangodb_to_cugraph(
+            "fraud-detection", {"vertexCollections": {"account": set()}}
+        )
+
+
+def test_adb_to_cug_empty_collection() -> None:
+    db.delete_collection("emptyEdges", ignore_missing=True)
+    db.create_collection("emptyEdges", edge=True)
+
+    metagraph: ADBMetagraph = {
+        "vertexCollections": {"account": set()},
+        "edgeCollections": {"transaction": set(), "emptyEdges": set()},
+    }
+
+    cug_g = adbcug_adapter.arangodb_to_cugraph("fraud-detection", metagraph)
+    assert len(cug_g.view_edge_list()) == db.collection("transaction").count()
+    assert_cugraph_data(cug_g, metagraph)
+
+    db.delete_collection("emptyEdges")
+
+
+def test_adb_to_cug_default_weights() -> None:
+    db.delete_collection("mixedEdges", ignore_missing=True)
+    db.create_collection("mixedEdges", edge=True).import_bulk(
+        [
+            {"_from": "nodes/1", "_to": "nodes/2", "weights": 3},
+            {"_from": "nodes/2", "_to": "nodes/3"},
+            {"_from": "nodes/3", "_to": "nodes/1", "weights": None},
+        ]
+    )
+
+    metagraph: ADBMetagraph = {
+        "vertexCollections": {"nodes": set()},
+        "edgeCollections": {"mixedEdges": set()},
+    }
+
+    cug_g = adbcug_adapter.arangodb_to_cugraph(
+        "mixed", metagraph, default_edge_attr_value=7
+    )
+
+    df = cug_g.view_edge_list().to_pandas()
+    assert dict(zip(zip(df["src"], df["dst"]), df["weights"])) == {
+        ("nodes/1", "nodes/2"): 3,
+        ("nodes/2", "nodes/3"): 7,
+        ("nodes/3", "nodes/1"): 7,
+    }
+
+    db.delete_collection("mixedEdges")
+
+
+def test_adb_to_cug_prepared_vertices() -> None:
+    class Custom_ADBCUG_Controller(ADBCUG_Controller):
+        def _prepare_arangodb_vertex(self, adb_vertex: Json, col: str) -> None:
+            # Only re-identify accounts, leaving customers unmapped
+            if col == "account":
+                adb_vertex["_id"] = adb_vertex["_id"].split("/")[1]
+
+    def get_cug_id(adb_id: str) -> str:
+        col, key = adb_id.split("/")
+        return key if col == "account" else adb_id
+
+    metagraph: ADBMetagraph = {
+        "vertexCollections": {"account": set(), "customer": set()},
+        "edgeCollections": {"accountHolder": set(), "transaction": set()},
+    }
+
+    adapter = ADBCUG_Adapter(db, Custom_ADBCUG_Controller())
+    cug_g = adapter.arangodb_to_cugraph("fraud-detection", metagraph)
+
+    expected_edges = sorted(
+        (get_cug_id(adb_e["_from"]), get_cug_id(adb_e["_to"]))
+        for e_col in metagraph["edgeCollections"]
+        for adb_e in db.collection(e_col)
+    )
+
+    df = cug_g.view_edge_list().to_pandas()
+    assert sorted(zip(df["src"], df["dst"])) == expected_edges
+
+    expected_nodes = {cug_id for edge in expected_edges for cug_id in edge}
+    assert set(cug_g.nodes().to_arrow().to_pylist()) == expected_nodes
+    assert any(cug_id.startswith("customer/") for cug_id in expected_nodes)
+
+
+@pytest.mark.parametrize("edge_attr", ["transaction_amt", "sender_bank_id"])
+def test_adb_to_cug_weight_dtype(edge_attr: str) -> None:
+    # 'sender_bank_id' holds integers above 2^24, which lose float32 precision
+    cug_g = adbcug_adapter.arangodb_graph_to_cugraph(
+        "fraud-detection", edge_attr=edge_attr, weight_dtype="float32"
+    )
+
+    weights = cug_g.view_edge_list()[edge_attr]
+    assert weights.dtype == "float32"
+    assert weights.max() == pytest.approx(
+        max(e[edge_attr] for e in db.collection("transaction") if edge_attr in e),
+        rel=1e-6,
+    )
+
+
 @pytest.mark.parametrize(
     "adapter, name, v_cols, e_cols",
     [
@@ -137,7 +255,7 @@ def test_adb_graph_to_cug(
 
 @pytest.mark.parametrize(
     "adapter, name, cug_g, edge_definitions, orphan_collections, \
-        overwrite_graph, batch_size, edge_attr, adb_import_kwargs",
+        overwrite_graph, batch_size, use_async, edge_attr, adb_import_kwargs",
     [
         (
             adbcug_adapter,
@@ -153,6 +271,25 @@ def test_adb_graph_to_cug(
             None,
             False,
             50,
+            False,
+            "quotient",
+            {"on_duplicate": "replace"},
+        ),
+        (
+            adbcug_adapter,
+            "DivisibilityGraph",
+            get_divisibility_graph(),
+            [
+                {
+                    "edge_collection": "is_divisible_by",
+                    "from_vertex_collections": ["numbers"],
+                    "to_vertex_collections": ["numbers"],
+                }
+            ],
+            None,
+            True,
+            50,
+            True,
             "quotient",
             {"on_duplicate": "replace"},
         ),
@@ -170,6 +307,7 @@ def test_adb_graph_to_cug(
             None,
             True,
             1,
+            False,
             "quotient",
             {"on_duplicate": "replace"},
         ),
@@ -187,6 +325,7 @@ def test_adb_graph_to_cug(
             None,
             True,
             1,
+            False,
             None,
             {"overwrite": True},
         ),
@@ -200,6 +339,7 @@ def test_cug_to_adb(
     orphan_collections: Optional[List[str]],
     overwrite_graph: bool,
     batch_size: int,
+    use_async: bool,
     edge_attr: Optional[str],
     adb_import_kwargs: Dict[str, Any],
 ) -> None:
@@ -210,6 +350,7 @@ def test_cug_to_adb(
         orphan_collections,
         overwrite_graph,
         batch_size=batch_size,
+        use_async=use_async,
         edge_attr=edge_attr,
         **adb_import_kwargs,
     )
@@ -221,6 +362,40 @@ def test_cug_to_adb(
     )
 
 
+@pytest.mark.parametrize(
+    "adb_import_kwargs", [{"overwrite": True}, {"on_duplicate": "replace"}]
+)
+def test_cug_to_adb_split_imports(
+    monkeypatch: pytest.MonkeyPatch, adb_import_kwargs: Dict[str, Any]
+) -> None:
+    # Split every collection into several asynchronous import jobs
+    monkeypatch.setattr("adbcug_adapter.adapter.MAX_ADB_IMPORT_SIZE", 10)
+
+    name = "DivisibilityGraph"
+    db.delete_graph(name, ignore_missing=True, drop_collections=True)
+
+    cug_g = get_divisibility_graph()
+    adb_g = adbcug_adapter.cugraph_to_arangodb(
+        name,
+        cug_g,
+        [
+            {
+                "edge_collection": "is_divisible_by",
+                "from_vertex_collections": ["numbers"],
+                "to_vertex_collections": ["numbers"],
+            }
+        ],
+        use_async=True,
+        edge_attr="quotient",
+        **adb_import_kwargs,
+    )
+
+    assert adb_g.vertex_collection("numbers").count() == len(cug_g.nodes())
+    assert adb_g.edge_collection("is_divisible_by").count() == len(
+        cug_g.view_edge_list()
+    )
+
+
 def test_cug_to_adb_invalid_collections() -> None:
     db.delete_graph("Drivers", ignore_missing=True, drop_collections=True)
 